@@ -1,10 +1,20 @@
 import pygame
+from pygame._sdl2.video import Window, Renderer, Texture
+from pygame.locals import QUIT, KEYDOWN, KEYUP, K_LEFT, K_RIGHT, K_UP, K_DOWN
 import sys
 import random
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: without it the kernels below run as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
+
 # -------------------- CONFIG -------------------- #
 BLOCK_SIZE = 30               # Size of each Tetris cell
+PREVIEW_BLOCK_SIZE = 20       # Size of each cell in the "Next" preview
 BOARD_WIDTH = 10              # Columns
 BOARD_HEIGHT = 20             # Rows
 WINDOW_WIDTH = 500            # Pixel width of the window
@@ -19,6 +29,10 @@ FPS = 60
 NORMAL_DROP_INTERVAL = 48     # Move down every 48 frames (level 0)
 SOFT_DROP_INTERVAL = 5        # Move down every 5 frames if Down key is held
 
+# Line flash before clearing
+FLASH_TIMES = 2               # Completed lines blink white this many times
+FLASH_FRAMES = 9              # Frames per on/off phase (~150 ms at 60 FPS)
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -34,6 +48,7 @@ SHAPES = {
     "J": [(0, 0), (0, 1), (1, 1), (2, 1)],
     "L": [(2, 0), (0, 1), (1, 1), (2, 1)],
 }
+SHAPE_KEYS = tuple(SHAPES)
 
 # Classic Tetris shape colors
 SHAPE_COLORS = {
@@ -46,6 +61,9 @@ SHAPE_COLORS = {
     "L": (255, 165, 0),     # Orange
 }
 
+# Board cells store a shape index: 0 = empty, 1..7 = shapes in SHAPE_KEYS order
+SHAPE_INDEX = {shape_key: idx for idx, shape_key in enumerate(SHAPE_KEYS, start=1)}
+
 # Piece-specific pivot dictionary (classic approach).
 # Each shape rotates around this pivot in local coords.
 PIECE_PIVOTS = {
@@ -59,6 +77,61 @@ PIECE_PIVOTS = {
 }
 
 
+# -------------------- ROTATIONS -------------------- #
+def rotate_piece_pivot(shape_key, blocks):
+    """
+    Rotate 90° clockwise around a piece-specific pivot from PIECE_PIVOTS.
+    1) Translate blocks so pivot -> (0,0)
+    2) (x,y)->(y,-x)
+    3) Translate back
+    4) Round to int
+    """
+    pivot_x, pivot_y = PIECE_PIVOTS[shape_key]
+    rotated = []
+    for (x, y) in blocks:
+        tx = x - pivot_x
+        ty = y - pivot_y
+        rx = ty
+        ry = -tx
+        fx = rx + pivot_x
+        fy = ry + pivot_y
+        rotated.append((int(round(fx)), int(round(fy))))
+    return rotated
+
+# All 4 orientations of each shape, computed once at import as read-only
+# (4, 2) int8 arrays. ROTATIONS[shape_key][i] is the shape after i clockwise
+# rotations, so pieces can be shared without copying.
+ROTATIONS = {}
+for _shape_key, _blocks in SHAPES.items():
+    ROTATIONS[_shape_key] = []
+    for _ in range(4):
+        _rotation = np.array(_blocks, np.int8)
+        _rotation.flags.writeable = False
+        ROTATIONS[_shape_key].append(_rotation)
+        _blocks = rotate_piece_pivot(_shape_key, _blocks)
+
+
+# -------------------- COLLISION -------------------- #
+@njit(cache=True)
+def blocks_collide(board, blocks, px, py):
+    """
+    Return True if `blocks` placed at (px, py) leave the board sideways,
+    go below the floor, or overlap a filled cell of `board`.
+    Rows above the board (y < 0) never collide.
+    """
+    height, width = board.shape
+    for i in range(blocks.shape[0]):
+        board_x = blocks[i, 0] + px
+        board_y = blocks[i, 1] + py
+        # Side walls & bottom boundary
+        if board_x < 0 or board_x >= width or board_y >= height:
+            return True
+        # Occupied cell
+        if board_y >= 0 and board[board_y, board_x]:
+            return True
+    return False
+
+
 # -------------------- 3D BLOCK RENDERING -------------------- #
 def lighten_color(rgb, amount=0.3):
     """Lighten an (r, g, b) color by a factor 0.0..1.0."""
@@ -76,6 +149,11 @@ def darken_color(rgb, amount=0.3):
     b = max(0, int(b - b * amount))
     return (r, g, b)
 
+# Every color a block is drawn in (WHITE is used for line flashes), with its
+# highlight & shadow precomputed
+BLOCK_COLORS = list(SHAPE_COLORS.values()) + [WHITE]
+SHADE_CACHE = {color: (lighten_color(color, 0.4), darken_color(color, 0.4)) for color in BLOCK_COLORS}
+
 def draw_3d_block(surface, base_color, x, y, size):
     """
     Draw a Tetris cell at (x, y) with dimension `size`,
@@ -84,9 +162,11 @@ def draw_3d_block(surface, base_color, x, y, size):
     # 1. Fill the main block
     pygame.draw.rect(surface, base_color, (x, y, size, size))
 
-    # 2. Generate highlight & shadow colors
-    highlight = lighten_color(base_color, 0.4)
-    shadow = darken_color(base_color, 0.4)
+    # 2. Look up (or generate) highlight & shadow colors
+    shades = SHADE_CACHE.get(base_color)
+    if shades is None:
+        shades = (lighten_color(base_color, 0.4), darken_color(base_color, 0.4))
+    highlight, shadow = shades
     edge_thick = 3
 
     # 3. Draw highlight on top & left
@@ -97,6 +177,12 @@ def draw_3d_block(surface, base_color, x, y, size):
     pygame.draw.rect(surface, shadow, (x, y + size - edge_thick, size, edge_thick))     # bottom
     pygame.draw.rect(surface, shadow, (x + size - edge_thick, y, edge_thick, size))     # right
 
+def make_block_surface(base_color, size):
+    """Pre-render one 3D block of dimension `size` onto its own Surface."""
+    surface = pygame.Surface((size, size))
+    draw_3d_block(surface, base_color, 0, 0, size)
+    return surface
+
 
 # -------------------- SOUND: BEEPS -------------------- #
 def generate_beep(freq=440, duration=0.2, volume=1.0, sample_rate=44100):
@@ -105,18 +191,23 @@ def generate_beep(freq=440, duration=0.2, volume=1.0, sample_rate=44100):
     Return it as a Pygame Sound object.
     """
     num_samples = int(sample_rate * duration)
-    t = np.linspace(0, duration, num_samples, endpoint=False)
-    waveform = (volume * np.sin(2.0 * np.pi * freq * t)).astype(np.float32)
-    waveform_int16 = (waveform * 32767).astype(np.int16).tobytes()
-    return pygame.mixer.Sound(buffer=waveform_int16)
+    # One float32 buffer, scaled in place, then a single cast to int16
+    waveform = np.arange(num_samples, dtype=np.float32)
+    waveform *= 2.0 * np.pi * freq / sample_rate
+    np.sin(waveform, out=waveform)
+    waveform *= volume * 32767
+    return pygame.mixer.Sound(buffer=waveform.astype(np.int16).tobytes())
 
 
 # -------------------- MAIN TETRIS CLASS -------------------- #
 class Tetris:
     def __init__(self):
         pygame.init()
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-        pygame.display.set_caption("Tetris - Classic")
+        # All drawing goes through the SDL2 renderer, with the static
+        # graphics uploaded once as textures
+        self.window = Window("Tetris - Classic", size=(WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.renderer = Renderer(self.window)
+        self.renderer.draw_color = (*WHITE, 255)
 
         # For held-key movement
         pygame.key.set_repeat(200, 50)
@@ -124,16 +215,51 @@ class Tetris:
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 36)
 
-        # Board: 2D array [BOARD_HEIGHT][BOARD_WIDTH], storing None or (r,g,b).
-        self.board = [[None for _ in range(BOARD_WIDTH)] for _ in range(BOARD_HEIGHT)]
+        # HUD text, only re-rendered when the value it shows changes
+        self.next_label = self.render_text("Next:")
+        self.score_shown = 0
+        self.score_text = self.render_text("Score: 0")
+        self.level_shown = 0
+        self.level_text = self.render_text("Level: 0")
+
+        # Pre-rendered cell textures, indexed by shape index (0 = empty, never drawn)
+        self.block_cache = [None] + [
+            Texture.from_surface(self.renderer, make_block_surface(SHAPE_COLORS[k], BLOCK_SIZE))
+            for k in SHAPE_KEYS
+        ]
+        self.preview_cache = [None] + [
+            Texture.from_surface(self.renderer, make_block_surface(SHAPE_COLORS[k], PREVIEW_BLOCK_SIZE))
+            for k in SHAPE_KEYS
+        ]
+        self.flash_block = Texture.from_surface(self.renderer, make_block_surface(WHITE, BLOCK_SIZE))
+
+        # Empty board: a thin grid, rendered once and drawn every frame
+        grid_surface = pygame.Surface((BOARD_WIDTH * BLOCK_SIZE, BOARD_HEIGHT * BLOCK_SIZE))
+        grid_surface.fill(WHITE)
+        for y in range(BOARD_HEIGHT):
+            for x in range(BOARD_WIDTH):
+                pygame.draw.rect(
+                    grid_surface, LIGHT_GRAY,
+                    (x * BLOCK_SIZE, y * BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE),
+                    1
+                )
+        self.grid_bg = Texture.from_surface(self.renderer, grid_surface)
+
+        # Pixel position of every board column / row, computed once
+        self.cell_xs = np.arange(BOARD_WIDTH) * BLOCK_SIZE + BOARD_ORIGIN_X
+        self.cell_ys = np.arange(BOARD_HEIGHT) * BLOCK_SIZE + BOARD_ORIGIN_Y
 
-        # Current & next piece
+        # Board: uint8 grid [BOARD_HEIGHT, BOARD_WIDTH] of shape indices (0 = empty)
+        self.board = np.zeros((BOARD_HEIGHT, BOARD_WIDTH), np.uint8)
+
+        # 7-bag randomizer: every shape once, in random order, per 7 spawns
+        self.piece_bag = []
+
+        # Current & next piece (current_blocks is always ROTATIONS[shape][rot_index])
         self.current_shape, self.current_blocks = self.generate_piece()
+        self.rot_index = 0
         self.next_shape, self.next_blocks = self.generate_piece()
 
-        self.current_color = SHAPE_COLORS[self.current_shape]
-        self.next_color = SHAPE_COLORS[self.next_shape]
-
         # Start near top-middle
         self.piece_x = BOARD_WIDTH // 2 - 2
         self.piece_y = 0
@@ -152,62 +278,125 @@ class Tetris:
         self.frame_count = 0
         self.drop_interval = NORMAL_DROP_INTERVAL
 
+        # KEYDOWN dispatch
+        self.key_handlers = {
+            K_LEFT: self.move_left,
+            K_RIGHT: self.move_right,
+            K_UP: self.rotate,
+            K_DOWN: self.start_soft_drop,
+        }
+
+        # Line flash in progress: (rows, frames_remaining, phase) or None.
+        # Even phases draw the rows white, odd phases in their own colors.
+        self.flash_state = None
+        # Movement keys pressed during a flash, replayed on the next piece
+        self.pending_keys = []
+
         # Sounds
         pygame.mixer.init()
         self.lock_beep = generate_beep(freq=300, duration=0.1, volume=0.5)
         self.line_clear_beep = generate_beep(freq=600, duration=0.15, volume=0.5)
 
+        # One dedicated channel per beep (a lock and a line clear can sound
+        # together), reserved so Sound.play() never hands them out
+        pygame.mixer.set_reserved(2)
+        self.lock_channel = pygame.mixer.Channel(0)
+        self.line_clear_channel = pygame.mixer.Channel(1)
+
+        # Compile the collision kernel now (a no-op without Numba) instead
+        # of stalling on the first gravity tick or key press
+        blocks_collide(self.board, self.current_blocks, self.piece_x, self.piece_y)
+
         self.running = True
         self.main_loop()
 
+    def render_text(self, text):
+        """Render `text` in the HUD font and upload it as a Texture."""
+        return Texture.from_surface(self.renderer, self.font.render(text, True, BLACK))
+
     def generate_piece(self):
-        """Pick a random shape, return (shape_key, list_of_offsets)."""
-        shape_key = random.choice(list(SHAPES.keys()))
-        return shape_key, SHAPES[shape_key][:]
+        """Draw a shape from the bag, return (shape_key, offsets) in its spawn orientation."""
+        if not self.piece_bag:
+            self.piece_bag = list(SHAPE_KEYS)
+            random.shuffle(self.piece_bag)
+        shape_key = self.piece_bag.pop()
+        return shape_key, ROTATIONS[shape_key][0]
 
     def main_loop(self):
+        # Bind the per-frame calls to locals once, outside the loop
+        handle_events = self.handle_events
+        update = self.update
+        draw = self.draw
+        tick = self.clock.tick
+
         while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(FPS)
+            handle_events()
+            update()
+            draw()
+            tick(FPS)
 
         pygame.quit()
         sys.exit()
 
     def handle_events(self):
         """Process user input (key presses)."""
+        key_handlers = self.key_handlers
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            event_type = event.type
+            if event_type == QUIT:
                 self.running = False
 
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_LEFT:
-                    if not self.check_collision(self.piece_x - 1, self.piece_y, self.current_blocks):
-                        self.piece_x -= 1
-
-                elif event.key == pygame.K_RIGHT:
-                    if not self.check_collision(self.piece_x + 1, self.piece_y, self.current_blocks):
-                        self.piece_x += 1
-
-                elif event.key == pygame.K_UP:
-                    # Rotate piece around its classic pivot
-                    rotated = self.rotate_piece_pivot(self.current_shape, self.current_blocks)
-                    if not self.check_collision(self.piece_x, self.piece_y, rotated):
-                        self.current_blocks = rotated
-
-                elif event.key == pygame.K_DOWN:
-                    # Activate soft drop
-                    self.soft_drop_active = True
-                    self.drop_interval = SOFT_DROP_INTERVAL
-
-            elif event.type == pygame.KEYUP:
-                if event.key == pygame.K_DOWN:
-                    self.soft_drop_active = False
-                    self.drop_interval = NORMAL_DROP_INTERVAL
+            elif event_type == KEYDOWN:
+                key = event.key
+                if self.flash_state is not None and key != K_DOWN:
+                    # The piece is already locked while lines flash; keep
+                    # the key for the next piece
+                    if key in key_handlers:
+                        self.pending_keys.append(key)
+                    continue
+
+                handler = key_handlers.get(key)
+                if handler is not None:
+                    handler()
+
+            elif event_type == KEYUP:
+                if event.key == K_DOWN:
+                    self.stop_soft_drop()
+
+    def move_left(self):
+        """Shift the piece one column left, unless blocked."""
+        if not self.check_collision(self.piece_x - 1, self.piece_y, self.current_blocks):
+            self.piece_x -= 1
+
+    def move_right(self):
+        """Shift the piece one column right, unless blocked."""
+        if not self.check_collision(self.piece_x + 1, self.piece_y, self.current_blocks):
+            self.piece_x += 1
+
+    def rotate(self):
+        """Rotate piece around its classic pivot (precomputed)."""
+        new_idx = (self.rot_index + 1) % 4
+        rotated = ROTATIONS[self.current_shape][new_idx]
+        if not self.check_collision(self.piece_x, self.piece_y, rotated):
+            self.rot_index = new_idx
+            self.current_blocks = rotated
+
+    def start_soft_drop(self):
+        """Activate soft drop (Down key pressed)."""
+        self.soft_drop_active = True
+        self.drop_interval = SOFT_DROP_INTERVAL
+
+    def stop_soft_drop(self):
+        """Restore normal falling speed (Down key released)."""
+        self.soft_drop_active = False
+        self.drop_interval = NORMAL_DROP_INTERVAL
 
     def update(self):
         """Update the game state each frame."""
+        if self.flash_state is not None:
+            self.update_line_flash()
+            return
+
         self.frame_count += 1
         if self.frame_count >= self.drop_interval:
             self.frame_count = 0
@@ -221,22 +410,25 @@ class Tetris:
                 # Check for completed lines
                 rows_cleared = self.check_complete_lines()
                 if rows_cleared:
-                    self.flash_and_remove_lines(rows_cleared)
+                    # The next piece spawns once the flash is over
+                    self.start_line_flash(rows_cleared)
+                else:
+                    self.spawn_next_piece()
 
-                # Spawn next piece
-                self.current_shape = self.next_shape
-                self.current_blocks = self.next_blocks
-                self.current_color = self.next_color
-                self.piece_x = BOARD_WIDTH // 2 - 2
-                self.piece_y = 0
+    def spawn_next_piece(self):
+        """Promote the "next" piece to the current one and generate a new "next"."""
+        self.current_shape = self.next_shape
+        self.current_blocks = self.next_blocks
+        self.rot_index = 0
+        self.piece_x = BOARD_WIDTH // 2 - 2
+        self.piece_y = 0
 
-                # Generate a new "next" piece
-                self.next_shape, self.next_blocks = self.generate_piece()
-                self.next_color = SHAPE_COLORS[self.next_shape]
+        # Generate a new "next" piece
+        self.next_shape, self.next_blocks = self.generate_piece()
 
-                # Game over check
-                if self.check_collision(self.piece_x, self.piece_y, self.current_blocks):
-                    self.running = False
+        # Game over check
+        if self.check_collision(self.piece_x, self.piece_y, self.current_blocks):
+            self.running = False
 
     def check_collision(self, px, py, blocks):
         """
@@ -244,67 +436,30 @@ class Tetris:
         the board or goes out of the valid region. We allow y<0 so a piece
         can start partly above the board or rotate above it.
         """
-        for (x_off, y_off) in blocks:
-            board_x = px + x_off
-            board_y = py + y_off
-            # Horizontal out-of-bounds
-            if board_x < 0 or board_x >= BOARD_WIDTH:
-                return True
-            # Bottom boundary
-            if board_y >= BOARD_HEIGHT:
-                return True
-            # Occupied cell
-            if 0 <= board_y < BOARD_HEIGHT:
-                if self.board[board_y][board_x] is not None:
-                    return True
-        return False
-
-    def rotate_piece_pivot(self, shape_key, blocks):
-        """
-        Rotate 90° clockwise around a piece-specific pivot from PIECE_PIVOTS.
-        1) Translate blocks so pivot -> (0,0)
-        2) (x,y)->(y,-x)
-        3) Translate back
-        4) Round to int
-        """
-        pivot_x, pivot_y = PIECE_PIVOTS[shape_key]
-        rotated = []
-        for (x, y) in blocks:
-            tx = x - pivot_x
-            ty = y - pivot_y
-            rx = ty
-            ry = -tx
-            fx = rx + pivot_x
-            fy = ry + pivot_y
-            rotated.append((int(round(fx)), int(round(fy))))
-        return rotated
+        return blocks_collide(self.board, blocks, px, py)
 
     def lock_piece(self):
         """Lock the current piece into the board, play the lock beep."""
         if self.lock_beep:
-            self.lock_beep.play()
+            self.lock_channel.play(self.lock_beep)
 
-        for (x_off, y_off) in self.current_blocks:
-            bx = self.piece_x + x_off
-            by = self.piece_y + y_off
-            if 0 <= by < BOARD_HEIGHT:
-                self.board[by][bx] = self.current_color
+        bxs = self.current_blocks[:, 0] + self.piece_x
+        bys = self.current_blocks[:, 1] + self.piece_y
+        visible = bys >= 0
+        self.board[bys[visible], bxs[visible]] = SHAPE_INDEX[self.current_shape]
 
     def check_complete_lines(self):
         """Find all fully-filled rows and return them as a list."""
-        completed = []
-        for row_idx in range(BOARD_HEIGHT):
-            if all(self.board[row_idx][col] is not None for col in range(BOARD_WIDTH)):
-                completed.append(row_idx)
-        return completed
+        return np.flatnonzero(self.board.all(axis=1)).tolist()
 
-    def flash_and_remove_lines(self, rows):
+    def start_line_flash(self, rows):
         """
-        Flash the completed lines, then remove them. Also update score,
-        total lines, level, etc.
+        Start flashing the completed lines and update score, total lines,
+        level, etc. The flash is advanced by update_line_flash() once per
+        frame, so the game loop keeps running meanwhile.
         """
         if self.line_clear_beep:
-            self.line_clear_beep.play()
+            self.line_clear_channel.play(self.line_clear_beep)
 
         lines_removed = len(rows)
         self.score += lines_removed * 100
@@ -314,37 +469,33 @@ class Tetris:
         # Check if we level up
         self.update_level()
 
-        # Flash lines a couple times
-        flash_times = 2
-        flash_delay = 150  # milliseconds
-
-        for _ in range(flash_times):
-            # Turn the line white
-            self.draw_completed_lines(rows, WHITE)
-            pygame.display.flip()
-            pygame.time.wait(flash_delay)
-
-            # Revert to original
-            self.draw_completed_lines(rows, None)
-            pygame.display.flip()
-            pygame.time.wait(flash_delay)
-
-        # Remove lines from the board
-        for row_idx in sorted(rows):
-            del self.board[row_idx]
-            self.board.insert(0, [None] * BOARD_WIDTH)
-
-    def draw_completed_lines(self, rows, color_override):
-        """Temporarily override lines with `color_override`, then self.draw()."""
-        saved_board = [row[:] for row in self.board]
-
-        if color_override is not None:
-            for r in rows:
-                for c in range(BOARD_WIDTH):
-                    self.board[r][c] = color_override
-
-        self.draw()
-        self.board = saved_board
+        self.flash_state = (rows, FLASH_FRAMES, 0)
+
+    def update_line_flash(self):
+        """Advance the line flash by one frame; remove the lines when it ends."""
+        rows, frames_remaining, phase = self.flash_state
+        frames_remaining -= 1
+        if frames_remaining > 0:
+            self.flash_state = (rows, frames_remaining, phase)
+        elif phase + 1 < 2 * FLASH_TIMES:
+            self.flash_state = (rows, FLASH_FRAMES, phase + 1)
+        else:
+            self.flash_state = None
+            self.remove_lines(rows)
+            self.spawn_next_piece()
+
+            # Apply the keys buffered during the flash to the new piece
+            pending_keys, self.pending_keys = self.pending_keys, []
+            if self.running:
+                for key in pending_keys:
+                    self.key_handlers[key]()
+
+    def remove_lines(self, rows):
+        """Remove the completed lines, dropping everything above them down."""
+        keep = np.ones(BOARD_HEIGHT, bool)
+        keep[rows] = False
+        empty_rows = np.zeros((len(rows), BOARD_WIDTH), np.uint8)
+        self.board = np.concatenate([empty_rows, self.board[keep]])
 
     def update_level(self):
         """
@@ -364,55 +515,73 @@ class Tetris:
 
     def draw(self):
         """Render the board, the current piece, the next piece, and the HUD info."""
-        self.screen.fill(WHITE)
-
-        # 1) Draw the board
-        for y in range(BOARD_HEIGHT):
-            for x in range(BOARD_WIDTH):
-                cell_color = self.board[y][x]
-                rx = BOARD_ORIGIN_X + x * BLOCK_SIZE
-                ry = BOARD_ORIGIN_Y + y * BLOCK_SIZE
-
-                if cell_color is None:
-                    # Empty cell: just draw a thin grid
-                    pygame.draw.rect(
-                        self.screen, LIGHT_GRAY,
-                        (rx, ry, BLOCK_SIZE, BLOCK_SIZE),
-                        1
-                    )
-                else:
-                    draw_3d_block(self.screen, cell_color, rx, ry, BLOCK_SIZE)
-
-        # 2) Draw the current falling piece (if visible)
-        for (x_off, y_off) in self.current_blocks:
-            rx = BOARD_ORIGIN_X + (self.piece_x + x_off) * BLOCK_SIZE
-            ry = BOARD_ORIGIN_Y + (self.piece_y + y_off) * BLOCK_SIZE
-            if ry < BOARD_HEIGHT * BLOCK_SIZE:
-                draw_3d_block(self.screen, self.current_color, rx, ry, BLOCK_SIZE)
-
-        # 3) Draw the "Next piece" preview
-        label_text = self.font.render("Next:", True, BLACK)
-        self.screen.blit(label_text, (320, 50))
-        self.draw_next_piece()
-
-        # 4) Draw the score
-        score_text = self.font.render(f"Score: {self.score}", True, BLACK)
-        self.screen.blit(score_text, (320, 200))
-
-        # 5) Draw the current level
-        level_text = self.font.render(f"Level: {self.level}", True, BLACK)
-        self.screen.blit(level_text, (320, 240))
-
-        pygame.display.flip()
-
-    def draw_next_piece(self):
-        """Draw the next piece in a small preview area at (320, 100)."""
-        PREVIEW_BLOCK_SIZE = 20
+        renderer = self.renderer
+        renderer.clear()
+
+        # Everything is collected into one (texture, dest) list and copied
+        # to the renderer in one pass, background grid first.
+        blit_list = [(self.grid_bg, (BOARD_ORIGIN_X, BOARD_ORIGIN_Y))]
+
+        # Rows drawn as white blocks this frame (the "on" phases of a line flash)
+        overlay_rows = []
+        if self.flash_state is not None:
+            rows, _, phase = self.flash_state
+            if phase % 2 == 0:
+                overlay_rows = rows
+
+        # 1) Filled board cells (empty ones are already on grid_bg)
+        block_cache = self.block_cache
+        ys, xs = np.nonzero(self.board)
+        cells = zip(self.cell_xs[xs].tolist(), self.cell_ys[ys].tolist(), self.board[ys, xs].tolist())
+        if overlay_rows:
+            # Overlay rows get the white block in place of their own
+            flash_texture = self.flash_block
+            overlay_ys = set(self.cell_ys[overlay_rows].tolist())
+            for rx, ry, idx in cells:
+                texture = flash_texture if ry in overlay_ys else block_cache[idx]
+                blit_list.append((texture, (rx, ry)))
+        else:
+            for rx, ry, idx in cells:
+                blit_list.append((block_cache[idx], (rx, ry)))
+
+        # 2) The current falling piece (if visible). While lines flash the
+        #    piece is already part of the board.
+        if self.flash_state is None:
+            piece_texture = self.block_cache[SHAPE_INDEX[self.current_shape]]
+            xs = self.current_blocks[:, 0] + self.piece_x
+            ys = self.current_blocks[:, 1] + self.piece_y
+            visible = ys >= 0
+            for rx, ry in zip(self.cell_xs[xs[visible]].tolist(), self.cell_ys[ys[visible]].tolist()):
+                blit_list.append((piece_texture, (rx, ry)))
+
+        # 3) The "Next piece" preview
+        blit_list.append((self.next_label, (320, 50)))
+        blit_list.extend(self.next_piece_blits())
+
+        # 4) The score
+        if self.score != self.score_shown:
+            self.score_text = self.render_text(f"Score: {self.score}")
+            self.score_shown = self.score
+        blit_list.append((self.score_text, (320, 200)))
+
+        # 5) The current level
+        if self.level != self.level_shown:
+            self.level_text = self.render_text(f"Level: {self.level}")
+            self.level_shown = self.level
+        blit_list.append((self.level_text, (320, 240)))
+
+        for texture, dest in blit_list:
+            texture.draw(dstrect=dest)
+        renderer.present()
+
+    def next_piece_blits(self):
+        """Return the blits for the next piece in a small preview area at (320, 100)."""
         x_base = 320
         y_base = 100
 
-        xs = [b[0] for b in self.next_blocks]
-        ys = [b[1] for b in self.next_blocks]
+        blocks = self.next_blocks.tolist()
+        xs = [b[0] for b in blocks]
+        ys = [b[1] for b in blocks]
         min_x, max_x = min(xs), max(xs)
         min_y, max_y = min(ys), max(ys)
 
@@ -422,13 +591,15 @@ class Tetris:
         offset_x = (4 - width) // 2
         offset_y = (4 - height) // 2
 
-        for (x_off, y_off) in self.next_blocks:
+        preview_texture = self.preview_cache[SHAPE_INDEX[self.next_shape]]
+        blit_list = []
+        for (x_off, y_off) in blocks:
             nx = x_off - min_x + offset_x
             ny = y_off - min_y + offset_y
             draw_x = x_base + nx * PREVIEW_BLOCK_SIZE
             draw_y = y_base + ny * PREVIEW_BLOCK_SIZE
-            draw_3d_block(self.screen, self.next_color, draw_x, draw_y, PREVIEW_BLOCK_SIZE)
-
+            blit_list.append((preview_texture, (draw_x, draw_y)))
+        return blit_list
 
 if __name__ == "__main__":
     Tetris()